@@ -1,21 +1,13 @@
 #!/usr/bin/env python3
 """Polkit Explorer 2.1 — with tag/value explanations + Ctrl-C handling"""
 
+import os
 import sys
 import signal
+from bisect import bisect_left
 from pathlib import Path
-from lxml import etree
 from PySide6 import QtCore, QtGui, QtWidgets
 
-# ──────────────────────────────────────────────────────────────────────────────
-#  OPTIONAL DARK / LIGHT STYLESHEET
-# ──────────────────────────────────────────────────────────────────────────────
-try:
-    import qdarktheme
-    _HAVE_DARKTHEME = True
-except ImportError:
-    _HAVE_DARKTHEME = False
-
 # ──────────────────────────────────────────────────────────────────────────────
 #  HUMAN-READABLE DESCRIPTIONS  (from polkit(8) + pklocalauthority(8))
 # ──────────────────────────────────────────────────────────────────────────────
@@ -39,27 +31,192 @@ VALUE_DESCS = {
                         "for a few minutes for the same process.",
 }
 
+# tag/value explanation HTML, built once per (tag, value) pair
+_EXPL_CACHE: dict[tuple[str, str], str] = {}
+
+def _expl(tag: str, value: str) -> str:
+    key = (tag, value)
+    html = _EXPL_CACHE.get(key)
+    if html is None:
+        tag_expl   = TAG_DESCS.get(tag,   "No description available.")
+        value_expl = VALUE_DESCS.get(value, "No description available.")
+        html = f"<b>{tag}</b>: {tag_expl}<br><b>{value}</b>: {value_expl}"
+        _EXPL_CACHE[key] = html
+    return html
+
+def _basename(path: str) -> str:
+    return path.rsplit("/", 1)[-1]
+
+_XML_LANG = "{http://www.w3.org/XML/1998/namespace}lang"
+_LOCALE   = QtCore.QLocale.system().name().replace('_', '-')
+
+# ──────────────────────────────────────────────────────────────────────────────
+#  LAZY LXML  (not imported until the first policy is opened)
+# ──────────────────────────────────────────────────────────────────────────────
+etree           = None
+_DESC_XPATH     = None
+_DEFAULTS_XPATH = None
+
+def _lxml():
+    """Import lxml and compile the XPath expressions on first use."""
+    global etree, _DESC_XPATH, _DEFAULTS_XPATH
+    if etree is None:
+        from lxml import etree as _etree
+        # compiled once; evaluating these is a single libxml2 call per action
+        _DESC_XPATH     = _etree.XPath("./description|./_description")
+        _DEFAULTS_XPATH = _etree.XPath("./defaults/*")
+        etree = _etree
+    return etree
+
+def _extract_action(action) -> tuple[str, list[tuple[str, str]]]:
+    """Return the localized description and the defaults of an <action>."""
+    desc = {}
+    for d in _DESC_XPATH(action):
+        desc.setdefault(d.get(_XML_LANG), (d.text or "").strip())
+    # the same handful of tags and values repeat across every action
+    defaults = [(sys.intern(d.tag), sys.intern(d.text or ""))
+                for d in _DEFAULTS_XPATH(action)]
+    return (desc.get(_LOCALE) or desc.get(None) or "«no description»",
+            defaults)
+
+def _parse_policy(policy_path: str, seen: dict[str, str] | None = None):
+    """Stream a .policy file into parallel (ids, descs, defaults) lists.
+
+    seen maps each action id to one shared str object; pass the same dict
+    for every file of a load so ids repeated across files are stored once.
+    """
+    ids, descs, defaults = [], [], []
+    if seen is None:
+        seen = {}
+    # iterparse pulls the input through read() in chunks whatever the source,
+    # so a path (which also names the file in parse errors) is all it needs
+    ctx = _lxml().iterparse(policy_path, events=("end",), tag="action",
+                            encoding="utf-8", huge_tree=False,
+                            remove_blank_text=True, remove_comments=True,
+                            collect_ids=False, no_network=True,
+                            resolve_entities=False)
+
+    # only one <action> subtree is alive at a time
+    for _, action in ctx:
+        act_id = action.get("id")
+        if act_id:
+            desc, dflt = _extract_action(action)
+            ids.append(seen.setdefault(act_id, act_id))
+            descs.append(desc)
+            defaults.append(dflt)
+        action.clear()
+        while action.getprevious() is not None:
+            del action.getparent()[0]
+    return ids, descs, defaults
+
+def _parse_policies(paths: list[str]):
+    """Parse several .policy files in turn and concatenate their columns.
+
+    Returns ((ids, descs, defaults), skipped) where skipped counts the files
+    that could not be read or parsed.
+    """
+    ids, descs, defaults = [], [], []
+    seen: dict[str, str] = {}           # shared by every file of this load
+    skipped = 0
+    for path in paths:
+        try:
+            i, d, dflt = _parse_policy(path, seen)
+        except (OSError, _lxml().Error):
+            skipped += 1
+            continue
+        ids      += i
+        descs    += d
+        defaults += dflt
+    return (ids, descs, defaults), skipped
+
+# ──────────────────────────────────────────────────────────────────────────────
+class _LoadSignals(QtCore.QObject):
+    loaded = QtCore.Signal(str, object, int)  # path, columns, skipped files
+    failed = QtCore.Signal(str, str)          # path, error message
+
+
+class _LoadWorker(QtCore.QRunnable):
+    """Parses a policy file, or every .policy in a directory, off the GUI."""
+
+    def __init__(self, policy_path: str):
+        super().__init__()
+        self.policy_path = policy_path
+        self.signals     = _LoadSignals()
+
+    def run(self):
+        # every outcome must emit, or the status bar sits on "Loading…"
+        try:
+            if os.path.isdir(self.policy_path):
+                columns, skipped = _parse_policies(sorted(
+                    str(p) for p in Path(self.policy_path).glob("*.policy")))
+            else:
+                columns, skipped = _parse_policy(self.policy_path), 0
+        except Exception as exc:
+            self.signals.failed.emit(self.policy_path, str(exc))
+        else:
+            self.signals.loaded.emit(self.policy_path, columns, skipped)
+
 # ──────────────────────────────────────────────────────────────────────────────
-class PolicyModel(QtGui.QStandardItemModel):
-    """A one-column tree model listing <action id=""> nodes."""
+class ActionListModel(QtCore.QAbstractListModel):
+    """A flat list of <action id=""> nodes with a built-in substring filter.
+
+    Per-action data lives in parallel lists; _visible holds the indices of
+    the actions whose id contains the current needle, in file order.
+    """
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setHorizontalHeaderLabels(["Action ID"])
-
-    def load(self, policy_path: str):
-        self.clear()
-        self.setHorizontalHeaderLabels(["Action ID"])
-        parser = etree.XMLParser(encoding="utf-8")
-        root = etree.parse(policy_path, parser).getroot()
-
-        for action in root.iter("action"):
-            act_id = action.get("id")
-            if act_id:
-                item = QtGui.QStandardItem(act_id)
-                item.setEditable(False)
-                item.setData(action, QtCore.Qt.UserRole)
-                self.appendRow(item)
+        self._ids:      list[str] = []
+        self._descs:    list[str] = []
+        self._defaults: list[list[tuple[str, str]]] = []
+        self._ids_ascii: list[bytes] = []
+        self._visible:   list[int] = []
+        self._needle = b""
+
+    def populate(self, ids, descs, defaults):
+        """Replace the actions; a new file always starts unfiltered."""
+        self.beginResetModel()
+        self._ids, self._descs, self._defaults = ids, descs, defaults
+        # action ids are ASCII, so matching can stay on lowered bytes
+        self._ids_ascii = [i.lower().encode("ascii", "ignore") for i in ids]
+        self._needle    = b""
+        self._visible   = list(range(len(ids)))
+        self.endResetModel()
+
+    def setNeedle(self, needle: str):
+        # "replace" turns non-ASCII input into '?', which no id contains
+        needle = needle.lower().encode("ascii", "replace")
+        if needle == self._needle:
+            return
+        self.beginResetModel()
+        self._needle  = needle
+        self._visible = self._matching()
+        self.endResetModel()
+
+    def indexOfAction(self, row: int) -> QtCore.QModelIndex:
+        """Index showing action *row*, or an invalid index if filtered out."""
+        i = bisect_left(self._visible, row)         # _visible is sorted
+        if i < len(self._visible) and self._visible[i] == row:
+            return self.index(i)
+        return QtCore.QModelIndex()
+
+    def _matching(self) -> list[int]:
+        n = self._needle
+        return [i for i, s in enumerate(self._ids_ascii) if n in s]
+
+    # ----- QAbstractListModel interface ↴
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._visible)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._visible[index.row()]
+        if role == QtCore.Qt.DisplayRole:
+            return self._ids[row]
+        if role == QtCore.Qt.UserRole:
+            return row
+        return None
 
 # ──────────────────────────────────────────────────────────────────────────────
 class Explorer(QtWidgets.QMainWindow):
@@ -71,36 +228,39 @@ class Explorer(QtWidgets.QMainWindow):
         self.setWindowTitle("Polkit Explorer 2.1")
         self.resize(960, 600)
         self.settings = QtCore.QSettings(self.SETTINGS_ORG, self.SETTINGS_APP)
+        self._loader  = None
+        self._resolved_cache: dict[str, str] = {}
 
         self._build_ui()
         self._build_menubar()
-        if _HAVE_DARKTHEME:
-            self._apply_theme()
+        self._apply_theme()
 
         self.statusBar().showMessage("Ready")
 
     # ─────────────────────────────── UI ───────────────────────────────
     def _build_ui(self):
-        # left: filter + tree --------------------------------------------------
+        # left: filter + list --------------------------------------------------
         self.filterEdit = QtWidgets.QLineEdit(placeholderText="Filter actions…")
-        self.tree       = QtWidgets.QTreeView(alternatingRowColors=True)
-        self.tree.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
-
-        self.model = PolicyModel(self)
-        self.proxy = QtCore.QSortFilterProxyModel(self)
-        self.proxy.setSourceModel(self.model)
-        self.proxy.setFilterCaseSensitivity(QtCore.Qt.CaseInsensitive)
-        self.tree.setModel(self.proxy)
-
-        self.filterEdit.textChanged.connect(self.proxy.setFilterFixedString)
-        self.tree.selectionModel().selectionChanged.connect(
+        self.actionList = QtWidgets.QListView(alternatingRowColors=True)
+        self.actionList.setSelectionMode(
+            QtWidgets.QAbstractItemView.SingleSelection)
+
+        self.model = ActionListModel(self)
+        self.actionList.setModel(self.model)
+
+        # re-filter only once typing pauses
+        self._filterTimer = QtCore.QTimer(self, singleShot=True, interval=150)
+        self._filterTimer.timeout.connect(self._apply_filter)
+        self.filterEdit.textChanged.connect(
+            lambda _: self._filterTimer.start())
+        self.actionList.selectionModel().selectionChanged.connect(
             self._on_action_selected)
 
         left = QtWidgets.QWidget()
         vbox = QtWidgets.QVBoxLayout(left)
         vbox.setContentsMargins(0, 0, 0, 0)
         vbox.addWidget(self.filterEdit)
-        vbox.addWidget(self.tree)
+        vbox.addWidget(self.actionList)
 
         # right: description + defaults table + explanation -------------------
         self.descLabel = QtWidgets.QLabel(wordWrap=True,
@@ -147,8 +307,29 @@ class Explorer(QtWidgets.QMainWindow):
                                  "&Open…", self, shortcut=QtGui.QKeySequence.Open,
                                  triggered=self.open_file)
         file_menu.addAction(open_act)
+        file_menu.addAction(QtGui.QAction("Open &Directory…", self,
+                                          triggered=self.open_directory))
+
+        # a fixed pool of actions, re-labelled as the recent list changes
+        self.recent_menu     = file_menu.addMenu("Open &Recent")
+        self._recents        = self.settings.value("recent", [], type=list)
+        self._recent_names   = self.settings.value("recent_names", [], type=list)
+        if len(self._recent_names) != len(self._recents):   # older settings
+            self._recent_names = [_basename(p) for p in self._recents]
+        self._noRecentAct    = QtGui.QAction("(none)", self, enabled=False)
+        self._recent_actions = [
+            QtGui.QAction(self, visible=False,
+                          triggered=self._on_recent_triggered)
+            for _ in range(self.MAX_RECENT)]
+        self.recent_menu.addAction(self._noRecentAct)
+        self.recent_menu.addActions(self._recent_actions)
+        self.recent_menu.addSeparator()
+        self.recent_menu.addAction(QtGui.QAction("Clear list", self,
+                                                 triggered=self._clear_recent))
 
-        self.recent_menu = file_menu.addMenu("Open &Recent")
+        # rapid opens coalesce into a single settings write
+        self._settingsTimer = QtCore.QTimer(self, singleShot=True, interval=500)
+        self._settingsTimer.timeout.connect(self._save_recent)
         self._populate_recent()
 
         file_menu.addSeparator()
@@ -161,60 +342,114 @@ class Explorer(QtWidgets.QMainWindow):
                                           triggered=self._show_about))
 
     # ─────────────────────────── Slots ────────────────────────────────
-    def open_file(self, checked: bool = False, path: str | None = None):
-        """Slot for File→Open and for Recent-file actions."""
-        if isinstance(checked, str) and path is None:     # called via lambda
-            path, checked = checked, False
-
-        if path is None or isinstance(path, bool):
-            path, _ = QtWidgets.QFileDialog.getOpenFileName(
-                self, "Open PolicyKit file",
-                "/usr/share/polkit-1/actions/", "*.policy")
-            if not path:
-                return
-
+    def open_file(self, checked: bool = False):
+        """Slot for File→Open."""
+        path, _ = QtWidgets.QFileDialog.getOpenFileName(
+            self, "Open PolicyKit file",
+            "/usr/share/polkit-1/actions/", "*.policy")
+        if path:
+            self._load_policy(path)
+
+    def open_directory(self, checked: bool = False):
+        """Slot for File→Open Directory: load every .policy file in it."""
+        path = QtWidgets.QFileDialog.getExistingDirectory(
+            self, "Open PolicyKit directory", "/usr/share/polkit-1/actions/")
+        if path:
+            self._load_policy(path)
+
+    def open_recent(self, path: str):
+        """Slot for the Open Recent entries."""
         self._load_policy(path)
-        self._add_recent(path)
 
     def _load_policy(self, policy_path: str):
-        self.model.load(policy_path)
-        self.tree.expandAll()
+        try:
+            _lxml()
+        except ImportError as exc:              # lxml is only needed from here
+            self.statusBar().showMessage(
+                f"Could not load {_basename(policy_path)}: {exc}", 5000)
+            return
+
+        # parse off the GUI thread; the model is filled when the worker reports
+        self._loader = _LoadWorker(policy_path)
+        self._loader.signals.loaded.connect(self._on_policy_loaded)
+        self._loader.signals.failed.connect(self._on_policy_failed)
+        QtCore.QThreadPool.globalInstance().start(self._loader)
+        self.statusBar().showMessage(f"Loading {_basename(policy_path)}…")
+
+    def _is_current_load(self) -> bool:
+        # compare workers, not paths: the same file may be reopened mid-load
+        return (self._loader is not None
+                and self.sender() == self._loader.signals)
+
+    def _on_policy_loaded(self, policy_path: str, columns, skipped: int):
+        if not self._is_current_load():
+            return
+
+        # clear the filter now, not 150 ms later via the debounce timer
+        self._filterTimer.stop()
+        self.filterEdit.blockSignals(True)
         self.filterEdit.clear()
+        self.filterEdit.blockSignals(False)
+        self.model.populate(*columns)
+        self._clear_details()                   # the reset dropped the selection
         self.statusBar().showMessage(
-            f"Loaded {Path(policy_path).name} "
-            f"({self.model.rowCount()} actions)", 5000)
+            f"Loaded {_basename(policy_path)} "
+            f"({len(self.model._ids)} actions"
+            + (f", {skipped} file(s) skipped)" if skipped else ")"), 5000)
+        self._add_recent(policy_path)
+
+    def _on_policy_failed(self, policy_path: str, error: str):
+        if not self._is_current_load():
+            return
+        self.statusBar().showMessage(
+            f"Could not load {_basename(policy_path)}: {error}", 5000)
 
     # ----- selecting an action ↴
-    def _on_action_selected(self, selected, _ignored):
-        if not selected.indexes():
+    def _on_action_selected(self, _selected, _deselected):
+        indexes = self.actionList.selectionModel().selectedIndexes()
+        if not indexes:
+            self._clear_details()
             return
-        idx       = selected.indexes()[0]
-        src_idx   = self.proxy.mapToSource(idx)
-        action_el = src_idx.data(QtCore.Qt.UserRole)
-
-        locale = QtCore.QLocale.system().name().replace('_', '-')
-        ns     = {"xml": "http://www.w3.org/XML/1998/namespace"}
-        nodes  = action_el.xpath(f"./description[@xml:lang='{locale}']",
-                                 namespaces=ns)
-        desc_el = nodes[0] if nodes else (
-            action_el.find("description") or action_el.find("_description"))
-
-        self.descLabel.setText(
-            desc_el.text.strip() if desc_el is not None and desc_el.text
-            else "«no description»")
-
-        # populate defaults table
-        self.defaults.setRowCount(0)
-        defaults_el = action_el.find("defaults")
-        if defaults_el is not None:
-            for child in defaults_el:
-                r = self.defaults.rowCount()
-                self.defaults.insertRow(r)
-                self.defaults.setItem(r, 0, QtWidgets.QTableWidgetItem(child.tag))
-                self.defaults.setItem(r, 1, QtWidgets.QTableWidgetItem(child.text or ""))
+        row = indexes[0].data(QtCore.Qt.UserRole)
+
+        self.descLabel.setText(self.model._descs[row])
+
+        # populate defaults table: size it once, then fill
+        rows = self.model._defaults[row]
+        self.defaults.blockSignals(True)
+        self.defaults.setUpdatesEnabled(False)
+        self.defaults.setRowCount(0)            # drop old selection/current cell
+        self.defaults.setRowCount(len(rows))
+        for r, (tag, value) in enumerate(rows):
+            self.defaults.setItem(r, 0, QtWidgets.QTableWidgetItem(tag))
+            self.defaults.setItem(r, 1, QtWidgets.QTableWidgetItem(value))
+        self.defaults.setUpdatesEnabled(True)
+        self.defaults.blockSignals(False)
+
+        self.explLabel.clear()
 
+    def _clear_details(self):
+        self.descLabel.clear()
+        self.defaults.setRowCount(0)
         self.explLabel.clear()
 
+    # ----- filtering the action list ↴
+    def _apply_filter(self):
+        # a model reset drops the selection without emitting selectionChanged,
+        # so carry the selected action across it by hand
+        indexes = self.actionList.selectionModel().selectedIndexes()
+        row = indexes[0].data(QtCore.Qt.UserRole) if indexes else None
+
+        self.model.setNeedle(self.filterEdit.text())
+
+        idx = (self.model.indexOfAction(row) if row is not None
+               else QtCore.QModelIndex())
+        if idx.isValid():
+            self.actionList.setCurrentIndex(idx)
+            self.actionList.scrollTo(idx)
+        else:
+            self._clear_details()
+
     # ----- selecting a row in Defaults ↴
     def _on_default_row_selected(self):
         row = self.defaults.currentRow()
@@ -223,40 +458,57 @@ class Explorer(QtWidgets.QMainWindow):
             return
         tag   = self.defaults.item(row, 0).text()
         value = self.defaults.item(row, 1).text()
-
-        tag_expl   = TAG_DESCS.get(tag,   "No description available.")
-        value_expl = VALUE_DESCS.get(value, "No description available.")
-
-        self.explLabel.setText(
-            f"<b>{tag}</b>: {tag_expl}<br><b>{value}</b>: {value_expl}")
+        self.explLabel.setText(_expl(tag, value))
 
     # ───────────────────────── Recent files ───────────────────────────
     MAX_RECENT = 5
 
     def _add_recent(self, path: str):
-        recents = self.settings.value("recent", [], type=list)
-        path    = str(Path(path).resolve())
-        if path in recents:
-            recents.remove(path)
-        recents.insert(0, path)
-        self.settings.setValue("recent", recents[:self.MAX_RECENT])
+        # resolve() walks the filesystem; do it once per distinct path
+        resolved = self._resolved_cache.get(path)
+        if resolved is None:
+            resolved = self._resolved_cache.setdefault(
+                path, str(Path(path).resolve()))
+        path = resolved
+        if path in self._recents:
+            i = self._recents.index(path)
+            del self._recents[i], self._recent_names[i]
+        self._recents.insert(0, path)
+        self._recent_names.insert(0, _basename(path))
+        del self._recents[self.MAX_RECENT:], self._recent_names[self.MAX_RECENT:]
         self._populate_recent()
+        self._settingsTimer.start()
 
     def _populate_recent(self):
-        self.recent_menu.clear()
-        recents = self.settings.value("recent", [], type=list)
-        if not recents:
-            self.recent_menu.addAction(QtGui.QAction("(none)", self,
-                                                     enabled=False))
-        else:
-            for p in recents:
-                act = QtGui.QAction(Path(p).name, self,
-                                    triggered=lambda _, p=p: self.open_file(p))
-                self.recent_menu.addAction(act)
-        self.recent_menu.addSeparator()
-        self.recent_menu.addAction(
-            QtGui.QAction("Clear list", self,
-                          triggered=lambda: self.settings.remove("recent")))
+        for i, act in enumerate(self._recent_actions):
+            if i < len(self._recents):
+                act.setText(self._recent_names[i])
+                act.setData(self._recents[i])
+                act.setVisible(True)
+            else:
+                act.setVisible(False)
+        self._noRecentAct.setVisible(not self._recents)
+
+    def _on_recent_triggered(self):
+        self.open_recent(self.sender().data())
+
+    def _clear_recent(self):
+        self._recents.clear()
+        self._recent_names.clear()
+        self._populate_recent()
+        self._settingsTimer.stop()
+        self.settings.remove("recent")
+        self.settings.remove("recent_names")
+
+    def _save_recent(self):
+        self.settings.setValue("recent", self._recents)
+        self.settings.setValue("recent_names", self._recent_names)
+
+    def closeEvent(self, event):
+        if self._settingsTimer.isActive():      # flush a pending write
+            self._settingsTimer.stop()
+            self._save_recent()
+        super().closeEvent(event)
 
     # ────────────────────────── Helpers ───────────────────────────────
     def _show_about(self):
@@ -268,6 +520,10 @@ class Explorer(QtWidgets.QMainWindow):
             "© 2013-2025  Kevin Cave & contributors")
 
     def _apply_theme(self):
+        try:
+            import qdarktheme                       # optional dependency
+        except ImportError:
+            return
         luminance = QtWidgets.QApplication.palette().color(
             QtGui.QPalette.Window).value()
         mode = "dark" if luminance < 128 else "light"